@@ -1,9 +1,10 @@
 # config_manager.py
+import functools
 import json
 import sys
 import os
-import tkinter as tk
-from tkinter import messagebox, ttk, filedialog
+
+from sql_engine import MAX_INSERT_ROWS
 
 def resource_path(filename):
     """ Get absolute path to resource, works for dev and for PyInstaller bundle """
@@ -11,11 +12,10 @@ def resource_path(filename):
         return os.path.join(sys._MEIPASS, filename)
     return os.path.join(os.path.abspath("."), filename)
 
+@functools.lru_cache(maxsize=1)
 def get_config_path():
-    import platform
-    import os
-
-    if platform.system() == "Windows":
+    """ Resolve (and create) the per-user config location once per process """
+    if sys.platform == "win32":
         app_name = "SQLTableBuilderPro"
         base_dir = os.environ.get("APPDATA", os.path.expanduser("~"))
         config_dir = os.path.join(base_dir, app_name)
@@ -25,54 +25,173 @@ def get_config_path():
     os.makedirs(config_dir, exist_ok=True)
     return os.path.join(config_dir, "config.json")
 
-CONFIG_FILE = get_config_path()
+# json.dumps() builds a fresh encoder whenever non-default options are
+# passed, so keep the compact one around for save()
+_compact_encoder = json.JSONEncoder(separators=(',', ':'))
+
+# Parsed config files keyed by path: {path: ((st_mtime_ns, st_size), parsed_dict)}
+_parse_cache = {}
 
 class ConfigManager:
-    def __init__(self, path=CONFIG_FILE):
-        self.path = path
-        self.config = {
-            "default_database": "",
-            "default_schema": "dbo",
-            "max_additional_columns": 1,
-            "default_preview_percentage": 10,
-            "sample_percentage": 15,
-            "default_infer_types": True,
-            "default_include_create": True,
-            "default_include_insert": True,
-            "default_batch_insert": False,
-            "default_truncate": False,
-            "insert_batch_size": 5000,
-            "use_filename_as_table_name": True,
-            "custom_table_name": "",
-            "auto_preview_data": True,
-            "default_column_format": "Source File",
-            "large_file_threshold_mb": 1000,
-            "enable_logging": True,
-            "log_directory": ""
-        }
+    # ttk styles live in each Tk interpreter, so configure them once per interpreter
+    _styled_interpreters = set()
+
+    # Every setting with its default; the default's type is the setting's type
+    DEFAULTS = {
+        "default_database": "",
+        "default_schema": "dbo",
+        "max_additional_columns": 1,
+        "default_preview_percentage": 10,
+        "sample_percentage": 15,
+        "default_infer_types": True,
+        "default_include_create": True,
+        "default_include_insert": True,
+        "default_batch_insert": False,
+        "default_truncate": False,
+        "insert_batch_size": 1000,
+        "use_filename_as_table_name": True,
+        "custom_table_name": "",
+        "auto_preview_data": True,
+        "default_column_format": "Source File",
+        "large_file_threshold_mb": 1000,
+        "enable_logging": True,
+        "log_directory": ""
+    }
+
+    # Settings entered as text that must be positive integers
+    _INT_KEYS = frozenset(key for key, value in DEFAULTS.items() if type(value) is int)
+    # Upper bounds for integer settings that the generator cannot exceed
+    _INT_LIMITS = {"insert_batch_size": MAX_INSERT_ROWS}
+
+    # Settings dialog layout: (tab text, heading, sections). Each section is
+    # (frame title, bottom gap, fields) and each field is (kind, key, label,
+    # size, bottom gap), where size is the entry width, the combobox values,
+    # or (entry width, frame title, info text) for a directory picker.
+    _SETTINGS_TABS = (
+        ("Configuration", "Database Configuration", (
+            ("Default Values", 15, (
+                ("entry", "default_database", "Database Name:", 25, 10),
+                ("entry", "default_schema", "Schema Name:", 25, 10),
+                ("check", "use_filename_as_table_name", "Use Filename as Table Name", None, 10),
+                ("entry", "custom_table_name", "Table Name:", 25, 0),
+            )),
+            ("Column Configuration", 10, (
+                ("check", "default_infer_types", "Enable Data Type Inference", None, 15),
+                ("combo", "default_column_format", "Default Column Format:",
+                 ("Source File", "CamelCase", "snake_case", "lowercase", "UPPERCASE"), 10),
+                ("entry", "max_additional_columns", "Maximum Additional Columns:", 5, 0),
+            )),
+        )),
+        ("Data Processing", "Data Processing Configuration", (
+            ("Data Sampling", 0, (
+                ("check", "auto_preview_data", "Automatically Preview Data", None, 15),
+                ("entry", "default_preview_percentage", "Default Preview Percentage:", 5, 10),
+                ("entry", "sample_percentage", "Sample Percentage for Analysis:", 5, 10),
+                ("entry", "large_file_threshold_mb", "Large File Indicator (MB):", 8, 0),
+            )),
+        )),
+        ("SQL Generation", "SQL Generation Options", (
+            ("Statement Generation", 15, (
+                ("check", "default_include_create", "Enable CREATE TABLE statements", None, 10),
+                ("check", "default_include_insert", "Enable INSERT statements", None, 0),
+            )),
+            ("Insert Statement Options", 0, (
+                ("check", "default_truncate", "Enable TRUNCATE", None, 10),
+                ("check", "default_batch_insert", "Enable Batch INSERT", None, 10),
+                ("entry", "insert_batch_size", "Insert Batch Size:", 12, 10),
+            )),
+        )),
+        ("Logging", "Logging Configuration", (
+            ("Logging Options", 15, (
+                ("check", "enable_logging", "Enable Logging", None, 15),
+                ("dir", "log_directory", "Custom Log Directory:",
+                 (55, "Log Directory",
+                  "If left empty, log will be saved to the same directory\nas the SQL script(s)"), 10),
+            )),
+        )),
+    )
+
+    # (checkbox key, controlled key, enabled while the checkbox is cleared)
+    _SETTINGS_TOGGLES = (
+        ("use_filename_as_table_name", "custom_table_name", True),
+        ("default_batch_insert", "insert_batch_size", False),
+        ("enable_logging", "log_directory", False),
+    )
+
+    def __init__(self, path=None):
+        self.path = path or get_config_path()
+        self.config = dict(self.DEFAULTS)
+        # Hash of the config as last read from / written to disk (None = unknown)
+        self._saved_hash = None
         self.load()
 
+    def _config_hash(self):
+        """Cheap fingerprint of the current config used to skip no-op saves"""
+        return hash(tuple(sorted((key, repr(value)) for key, value in self.config.items())))
+
     def load(self):
-        if os.path.exists(self.path):
-            try:
-                with open(self.path, 'r') as f:
-                    self.config.update(json.load(f))
-            except Exception as e:
-                print(f"Error loading config: {e}")
+        try:
+            # Open directly rather than checking os.path.exists first: one
+            # syscall instead of two, and no window for the file to vanish
+            with open(self.path, 'rb') as f:
+                # Reuse the previous parse while the file's mtime/size are unchanged
+                st = os.fstat(f.fileno())
+                stamp = (st.st_mtime_ns, st.st_size)
+                cached = _parse_cache.get(self.path)
+                if cached is None or cached[0] != stamp:
+                    # An empty file (e.g. truncated by an editor) just means no overrides
+                    cached = (stamp, json.loads(f.read()) if st.st_size else {})
+                    _parse_cache[self.path] = cached
+            self.config.update(cached[1])
+            self._saved_hash = self._config_hash()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error loading config: {e}")
 
     def save(self):
+        # Nothing to write if the config still matches what is on disk
+        if self._saved_hash is not None and self._saved_hash == self._config_hash():
+            return
         try:
-            with open(self.path, 'w') as f:
-                json.dump(self.config, f, indent=4)
+            # Serialize up front and write once to a sibling file, then swap it
+            # into place so an interrupted save never leaves a truncated config
+            # The file is app-managed, so write it compactly
+            data = _compact_encoder.encode(self.config).encode('utf-8')
+            # The hash is unknown after a failed load; compare bytes instead
+            try:
+                with open(self.path, 'rb') as f:
+                    if f.read() == data:
+                        self._saved_hash = self._config_hash()
+                        return
+            except FileNotFoundError:
+                pass
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+                st = os.fstat(f.fileno())
+            os.replace(tmp_path, self.path)
+            # The rename keeps mtime/size, so the next load() can reuse this
+            _parse_cache[self.path] = ((st.st_mtime_ns, st.st_size), dict(self.config))
+            self._saved_hash = self._config_hash()
         except Exception as e:
             print(f"Error saving config: {e}")
 
-    def setup_button_styles(self):
+    def setup_button_styles(self, master):
         """Configure button styles with compact design and light blue theme"""
-        style = ttk.Style()
+        interpreter = str(master.tk)
+        if interpreter in ConfigManager._styled_interpreters:
+            return
+
+        from tkinter import ttk
+
+        style = ttk.Style(master)
         
-        # Configure light blue button style - smaller with black text on light blue
-        style.configure('LightBlue.TButton',
+        # Configure light blue button style - smaller with black text on light blue.
+        # The name is the dialog's own, so other windows' styles cannot change it.
+        style.configure('Settings.TButton',
                        background='#ADD8E6',  # Light blue
                        foreground='black',
                        padding=(6, 3),        # Reduced from (15, 8)
@@ -82,27 +201,37 @@ class ConfigManager:
                        font=('Arial', 8))
         
         # Configure hover and pressed effects
-        style.map('LightBlue.TButton',
+        style.map('Settings.TButton',
                  background=[('active', '#87CEEB'),   # Slightly darker light blue
                             ('pressed', '#87CEFA')],  # Sky blue
                  relief=[('pressed', 'flat'),
                         ('!pressed', 'flat')])
+        
+        ConfigManager._styled_interpreters.add(interpreter)
 
     def open_settings_window(self, master, on_save_callback=None):
+        # Tk is only needed once the dialog is opened; load()/save() stay GUI-free
+        import tkinter as tk
+        from tkinter import ttk
+
         window = tk.Toplevel(master)
+        # Keep the dialog unmapped while it is built so Tk lays it out once
+        window.withdraw()
         window.title("Settings")
         window.geometry("420x560")  # Increased height to ensure buttons are fully visible
         window.resizable(False, False)
         
         # Center the window
         window.transient(master)
-        window.grab_set()
         
         # Configure window style
         window.configure(bg='#f0f0f0')
         
+        # Entry text for every setting, stringified once for this dialog's tab builders
+        display = {key: self._display_text(value) for key, value in self.config.items()}
+        
         # Setup button styling
-        self.setup_button_styles()
+        self.setup_button_styles(master)
         
         # Create main frame with padding
         main_frame = ttk.Frame(window, padding="20")
@@ -115,29 +244,24 @@ class ConfigManager:
         # Dictionary to store all entry widgets
         entries = {}
         
-        # Configuration Tab (moved to first position)
-        db_frame = ttk.Frame(notebook, padding="20")
-        notebook.add(db_frame, text="Configuration")
-        
-        self._create_database_tab(db_frame, entries)
-        
-        # Data Processing Tab  
-        processing_frame = ttk.Frame(notebook, padding="20")
-        notebook.add(processing_frame, text="Data Processing")
-        
-        self._create_processing_tab(processing_frame, entries)
-        
-        # SQL Generation Tab
-        sql_frame = ttk.Frame(notebook, padding="20")
-        notebook.add(sql_frame, text="SQL Generation")
-        
-        self._create_sql_tab(sql_frame, entries)
-        
-        # Logging Tab - NEW
-        logging_frame = ttk.Frame(notebook, padding="20")
-        notebook.add(logging_frame, text="Logging")
-        
-        self._create_logging_tab(logging_frame, entries)
+        # Add an empty frame per tab; each tab's widgets are only built the
+        # first time it is selected. Settings on tabs that were never opened
+        # have no entries, so _save_changes leaves them untouched.
+        pending_tabs = {}
+        for tab_text, heading, sections in self._SETTINGS_TABS:
+            tab_frame = ttk.Frame(notebook, padding="20")
+            notebook.add(tab_frame, text=tab_text)
+            pending_tabs[str(tab_frame)] = (tab_frame, heading, sections)
+        
+        def build_selected_tab(*args):
+            pending = pending_tabs.pop(notebook.select(), None)
+            if pending:
+                tab_frame, heading, sections = pending
+                self._build_settings_tab(tab_frame, heading, sections, entries, display)
+        
+        # Build the initially selected (Configuration) tab right away
+        build_selected_tab()
+        notebook.bind("<<NotebookTabChanged>>", build_selected_tab)
         
         # Button frame - inside main frame for guaranteed visibility
         button_frame = ttk.Frame(main_frame)
@@ -151,7 +275,7 @@ class ConfigManager:
         cancel_btn = ttk.Button(
             button_container, 
             text="Cancel", 
-            style='LightBlue.TButton',
+            style='Settings.TButton',
             width=8,  # Reduced from default
             command=window.destroy
         )
@@ -161,7 +285,7 @@ class ConfigManager:
         save_btn = ttk.Button(
             button_container, 
             text="Save Settings", 
-            style='LightBlue.TButton',
+            style='Settings.TButton',
             width=12,  # Reduced from default
             command=lambda: self._save_changes(entries, window, on_save_callback)
         )
@@ -169,318 +293,180 @@ class ConfigManager:
         
         # Set initial focus
         notebook.focus_set()
-
-    def _create_database_tab(self, parent, entries):
-        """Create database configuration section"""
-        # Title
-        title_label = ttk.Label(parent, text="Database Configuration", 
-                               font=('TkDefaultFont', 10, 'bold'))
-        title_label.pack(anchor=tk.W, pady=(0, 15))
-        
-        # Default Values (combined database and schema)
-        defaults_frame = ttk.LabelFrame(parent, text="Default Values", padding="15")
-        defaults_frame.pack(fill=tk.X, pady=(0, 15))
-        
-        # Database Name - horizontal layout
-        db_input_frame = ttk.Frame(defaults_frame)
-        db_input_frame.pack(fill=tk.X, pady=(0, 10))
-        ttk.Label(db_input_frame, text="Database Name:").pack(side=tk.LEFT)
-        db_entry = ttk.Entry(db_input_frame, width=25)
-        db_entry.insert(0, str(self.config.get("default_database", "")))
-        db_entry.pack(side=tk.LEFT, padx=(10, 0))
-        entries["default_database"] = db_entry
-        
-        # Schema Name - horizontal layout
-        schema_input_frame = ttk.Frame(defaults_frame)
-        schema_input_frame.pack(fill=tk.X, pady=(0, 10))
-        ttk.Label(schema_input_frame, text="Schema Name:").pack(side=tk.LEFT)
-        schema_entry = ttk.Entry(schema_input_frame, width=25)
-        schema_entry.insert(0, str(self.config.get("default_schema", "dbo")))
-        schema_entry.pack(side=tk.LEFT, padx=(10, 0))
-        entries["default_schema"] = schema_entry
-        
-        # Use Filename as Table Name checkbox
-        use_filename_var = tk.BooleanVar(value=self.config.get("use_filename_as_table_name", True))
-        use_filename_cb = ttk.Checkbutton(defaults_frame, text="Use Filename as Table Name", 
-                                         variable=use_filename_var)
-        use_filename_cb.pack(anchor=tk.W, pady=(0, 10))
-        entries["use_filename_as_table_name"] = use_filename_var
-        
-        # Custom Table Name - horizontal layout
-        table_input_frame = ttk.Frame(defaults_frame)
-        table_input_frame.pack(fill=tk.X)
-        table_label = ttk.Label(table_input_frame, text="Table Name:")
-        table_label.pack(side=tk.LEFT)
-        table_entry = ttk.Entry(table_input_frame, width=25)
-        table_entry.insert(0, str(self.config.get("custom_table_name", "")))
-        table_entry.pack(side=tk.LEFT, padx=(10, 0))
-        entries["custom_table_name"] = table_entry
-        
-        # Add callback to enable/disable table name input based on checkbox
-        def toggle_table_name(*args):
-            if use_filename_var.get():
-                table_label.configure(state='disabled')
-                table_entry.configure(state='disabled')
-            else:
-                table_label.configure(state='normal')
-                table_entry.configure(state='normal')
-        
-        # Set initial state based on checkbox value
-        toggle_table_name()
-        
-        # Monitor changes to use_filename_var and call toggle_table_name when it changes
-        use_filename_var.trace('w', toggle_table_name)
-        
-        # Column Settings (moved from processing tab)
-        col_frame = ttk.LabelFrame(parent, text="Column Configuration", padding="15")
-        col_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        # Type Inference (moved to top)
-        infer_var = tk.BooleanVar(value=self.config.get("default_infer_types", True))
-        infer_cb = ttk.Checkbutton(col_frame, text="Enable Data Type Inference", 
-                                  variable=infer_var)
-        infer_cb.pack(anchor=tk.W, pady=(0, 15))
-        entries["default_infer_types"] = infer_var
-        
-        # Default Column Format - horizontal layout
-        format_input_frame = ttk.Frame(col_frame)
-        format_input_frame.pack(fill=tk.X, pady=(0, 10))
-        ttk.Label(format_input_frame, text="Default Column Format:").pack(side=tk.LEFT)
-        
-        # Column format options
-        column_format_options = ["Source File", "CamelCase", "snake_case", "lowercase", "UPPERCASE"]
-        format_var = tk.StringVar(value=self.config.get("default_column_format", "Source File"))
-        format_combo = ttk.Combobox(format_input_frame, textvariable=format_var, 
-                                   values=column_format_options, width=15, state="readonly")
-        format_combo.pack(side=tk.LEFT, padx=(10, 0))
-        entries["default_column_format"] = format_var
         
-        # Maximum Additional Columns - horizontal layout
-        col_input_frame = ttk.Frame(col_frame)
-        col_input_frame.pack(fill=tk.X)
-        ttk.Label(col_input_frame, text="Maximum Additional Columns:").pack(side=tk.LEFT)
-        col_entry = ttk.Entry(col_input_frame, width=5)
-        col_entry.insert(0, str(self.config.get("max_additional_columns", 1)))
-        col_entry.pack(side=tk.LEFT, padx=(10, 0))
-        entries["max_additional_columns"] = col_entry
+        # Resolve geometry in a single pass, then show the finished dialog.
+        # The grab needs a viewable window, so it is taken after mapping.
+        window.update_idletasks()
+        window.deiconify()
+        window.grab_set()
 
-    def _create_processing_tab(self, parent, entries):
-        """Create data processing section"""
-        # Title
-        title_label = ttk.Label(parent, text="Data Processing Configuration", 
-                               font=('TkDefaultFont', 10, 'bold'))
-        title_label.pack(anchor=tk.W, pady=(0, 15))
-        
-        # Sample Settings
-        sample_frame = ttk.LabelFrame(parent, text="Data Sampling", padding="15")
-        sample_frame.pack(fill=tk.X)
-        
-        # Auto Preview Data checkbox - NEW ADDITION at the top
-        auto_preview_var = tk.BooleanVar(value=self.config.get("auto_preview_data", True))
-        auto_preview_cb = ttk.Checkbutton(sample_frame, text="Automatically Preview Data", 
-                                         variable=auto_preview_var)
-        auto_preview_cb.pack(anchor=tk.W, pady=(0, 15))
-        entries["auto_preview_data"] = auto_preview_var
-        
-        # Default Preview Percentage - horizontal layout
-        preview_input_frame = ttk.Frame(sample_frame)
-        preview_input_frame.pack(fill=tk.X, pady=(0, 10))
-        ttk.Label(preview_input_frame, text="Default Preview Percentage:").pack(side=tk.LEFT)
-        preview_entry = ttk.Entry(preview_input_frame, width=5)
-        preview_entry.insert(0, str(self.config.get("default_preview_percentage", 10)))
-        preview_entry.pack(side=tk.LEFT, padx=(10, 0))
-        entries["default_preview_percentage"] = preview_entry
-        
-        # Sample Percentage for Analysis - horizontal layout
-        sample_input_frame = ttk.Frame(sample_frame)
-        sample_input_frame.pack(fill=tk.X, pady=(0, 10))
-        ttk.Label(sample_input_frame, text="Sample Percentage for Analysis:").pack(side=tk.LEFT)
-        sample_entry = ttk.Entry(sample_input_frame, width=5)
-        sample_entry.insert(0, str(self.config.get("sample_percentage", 15)))
-        sample_entry.pack(side=tk.LEFT, padx=(10, 0))
-        entries["sample_percentage"] = sample_entry
-        
-        # Large File Indicator Threshold - horizontal layout
-        large_file_input_frame = ttk.Frame(sample_frame)
-        large_file_input_frame.pack(fill=tk.X)
-        ttk.Label(large_file_input_frame, text="Large File Indicator (MB):").pack(side=tk.LEFT)
-        large_file_entry = ttk.Entry(large_file_input_frame, width=8)
-        large_file_entry.insert(0, str(self.config.get("large_file_threshold_mb", 1000)))
-        large_file_entry.pack(side=tk.LEFT, padx=(10, 0))
-        entries["large_file_threshold_mb"] = large_file_entry
+    def _add_entry_row(self, parent, label_text, key, width, entries, display, pady=(0, 10)):
+        """Add a horizontal 'Label: [Entry]' row bound to a config key"""
+        import tkinter as tk
+        from tkinter import ttk
 
-    def _create_sql_tab(self, parent, entries):
-        """Create SQL generation section"""
-        # Title
-        title_label = ttk.Label(parent, text="SQL Generation Options", 
-                               font=('TkDefaultFont', 10, 'bold'))
-        title_label.pack(anchor=tk.W, pady=(0, 15))
-        
-        # Statement Generation
-        gen_frame = ttk.LabelFrame(parent, text="Statement Generation", padding="15")
-        gen_frame.pack(fill=tk.X, pady=(0, 15))
-        
-        create_var = tk.BooleanVar(value=self.config.get("default_include_create", True))
-        create_cb = ttk.Checkbutton(gen_frame, text="Enable CREATE TABLE statements", 
-                                   variable=create_var)
-        create_cb.pack(anchor=tk.W, pady=(0, 10))
-        entries["default_include_create"] = create_var
-        
-        insert_var = tk.BooleanVar(value=self.config.get("default_include_insert", True))
-        insert_cb = ttk.Checkbutton(gen_frame, text="Enable INSERT statements", 
-                                   variable=insert_var)
-        insert_cb.pack(anchor=tk.W)
-        entries["default_include_insert"] = insert_var
-        
-        # Insert Options
-        insert_frame = ttk.LabelFrame(parent, text="Insert Statement Options", padding="15")
-        insert_frame.pack(fill=tk.X)
-        
-        # Default Truncate option (at the top)
-        truncate_var = tk.BooleanVar(value=self.config.get("default_truncate", False))
-        truncate_cb = ttk.Checkbutton(insert_frame, text="Enable TRUNCATE", 
-                                     variable=truncate_var)
-        truncate_cb.pack(anchor=tk.W, pady=(0, 10))
-        entries["default_truncate"] = truncate_var
-        
-        batch_var = tk.BooleanVar(value=self.config.get("default_batch_insert", False))
-        batch_cb = ttk.Checkbutton(insert_frame, text="Enable Batch INSERT", 
-                                  variable=batch_var)
-        batch_cb.pack(anchor=tk.W, pady=(0, 10))
-        entries["default_batch_insert"] = batch_var
-        
-        # Batch Size Input - horizontal layout
-        batch_input_frame = ttk.Frame(insert_frame)
-        batch_input_frame.pack(fill=tk.X, pady=(0, 10))
-        batch_label = ttk.Label(batch_input_frame, text="Insert Batch Size:")
-        batch_label.pack(side=tk.LEFT)
-        batch_entry = ttk.Entry(batch_input_frame, width=12)
-        batch_entry.insert(0, str(self.config.get("insert_batch_size", 5000)))
-        batch_entry.pack(side=tk.LEFT, padx=(10, 0))
-        entries["insert_batch_size"] = batch_entry
-        
-        # Add callback to enable/disable batch size based on batch checkbox
-        def toggle_batch_size(*args):
-            if batch_var.get():
-                batch_label.configure(state='normal')
-                batch_entry.configure(state='normal')
-            else:
-                batch_label.configure(state='disabled')
-                batch_entry.configure(state='disabled')
-        
-        # Set initial state based on checkbox value
-        toggle_batch_size()
-        
-        # Monitor changes to batch_var and call toggle_batch_size when it changes
-        batch_var.trace('w', toggle_batch_size)
+        row_frame = ttk.Frame(parent)
+        row_frame.pack(fill=tk.X, pady=pady)
+        label = ttk.Label(row_frame, text=label_text)
+        label.pack(side=tk.LEFT)
+        entry = ttk.Entry(row_frame, width=width)
+        entry.insert(0, display[key])
+        entry.pack(side=tk.LEFT, padx=(10, 0))
+        entries[key] = entry
+        return label, entry
 
-    def _create_logging_tab(self, parent, entries):
-        """Create logging configuration section"""
-        # Title
-        title_label = ttk.Label(parent, text="Logging Configuration", 
-                               font=('TkDefaultFont', 10, 'bold'))
-        title_label.pack(anchor=tk.W, pady=(0, 15))
-        
-        # Logging Settings
-        logging_frame = ttk.LabelFrame(parent, text="Logging Options", padding="15")
-        logging_frame.pack(fill=tk.X, pady=(0, 15))
-        
-        # Enable Logging checkbox - at the top
-        enable_logging_var = tk.BooleanVar(value=self.config.get("enable_logging", True))
-        enable_logging_cb = ttk.Checkbutton(logging_frame, text="Enable Logging", 
-                                           variable=enable_logging_var)
-        enable_logging_cb.pack(anchor=tk.W, pady=(0, 15))
-        entries["enable_logging"] = enable_logging_var
-        
-        # Log Directory Settings
-        log_dir_frame = ttk.LabelFrame(logging_frame, text="Log Directory", padding="10")
-        log_dir_frame.pack(fill=tk.X, pady=(0, 10))
+    def _add_directory_row(self, parent, label_text, key, width, frame_title, info, entries, display,
+                           pady=(0, 10)):
+        """Add a titled 'Label / [Entry] / Browse...' directory picker bound to a config key"""
+        import tkinter as tk
+        from tkinter import ttk, filedialog
+
+        # Directory Settings
+        dir_frame = ttk.LabelFrame(parent, text=frame_title, padding="10")
+        dir_frame.pack(fill=tk.X, pady=pady)
         
-        # Custom log directory input
-        log_dir_input_frame = ttk.Frame(log_dir_frame)
-        log_dir_input_frame.pack(fill=tk.X, pady=(0, 10))
+        # Custom directory input
+        dir_input_frame = ttk.Frame(dir_frame)
+        dir_input_frame.pack(fill=tk.X, pady=(0, 10))
         
-        log_dir_label = ttk.Label(log_dir_input_frame, text="Custom Log Directory:")
-        log_dir_label.pack(anchor=tk.W, pady=(0, 5))
+        dir_label = ttk.Label(dir_input_frame, text=label_text)
+        dir_label.pack(anchor=tk.W, pady=(0, 5))
         
         # Directory path entry and browse button
-        dir_entry_frame = ttk.Frame(log_dir_input_frame)
+        dir_entry_frame = ttk.Frame(dir_input_frame)
         dir_entry_frame.pack(fill=tk.X)
         
-        log_dir_entry = ttk.Entry(dir_entry_frame, width=55)  # Increased width since Browse button is now below
-        log_dir_entry.insert(0, str(self.config.get("log_directory", "")))
-        log_dir_entry.pack(fill=tk.X, pady=(0, 5))  # Fill width and add bottom padding
-        entries["log_directory"] = log_dir_entry
+        dir_entry = ttk.Entry(dir_entry_frame, width=width)  # Wide since the Browse button sits below
+        dir_entry.insert(0, display[key])
+        dir_entry.pack(fill=tk.X, pady=(0, 5))  # Fill width and add bottom padding
+        entries[key] = dir_entry
         
         # Browse button below the entry field
-        def browse_log_directory():
-            directory = filedialog.askdirectory(title="Select Log Directory")
+        def browse_directory():
+            directory = filedialog.askdirectory(title=f"Select {frame_title}")
             if directory:
-                log_dir_entry.delete(0, tk.END)
-                log_dir_entry.insert(0, directory)
+                dir_entry.delete(0, tk.END)
+                dir_entry.insert(0, directory)
         
-        log_browse_btn = ttk.Button(dir_entry_frame, text="Browse...", 
-                                   style='LightBlue.TButton', width=12,
-                                   command=browse_log_directory)
-        log_browse_btn.pack(anchor=tk.W)  # Align to left
+        browse_btn = ttk.Button(dir_entry_frame, text="Browse...", 
+                                style='Settings.TButton', width=12,
+                                command=browse_directory)
+        browse_btn.pack(anchor=tk.W)  # Align to left
         
         # Information text
-        info_text = ttk.Label(log_dir_frame, text="If left empty, log will be saved to the same directory\nas the SQL script(s)", 
-                             font=('TkDefaultFont', 8), foreground='gray')
+        info_text = ttk.Label(dir_frame, text=info, 
+                              font=('TkDefaultFont', 8), foreground='gray')
         info_text.pack(anchor=tk.W, pady=(5, 0))
         
-        # Add callback to enable/disable log directory controls based on enable logging checkbox
-        def toggle_logging_controls(*args):
-            if enable_logging_var.get():
-                log_dir_label.configure(state='normal')
-                log_dir_entry.configure(state='normal')
-                log_browse_btn.configure(state='normal')
-                info_text.configure(state='normal')
-            else:
-                log_dir_label.configure(state='disabled')
-                log_dir_entry.configure(state='disabled')
-                log_browse_btn.configure(state='disabled')
-                info_text.configure(state='disabled')
-        
-        # Set initial state based on checkbox value
-        toggle_logging_controls()
+        return dir_label, dir_entry, browse_btn, info_text
+
+    @staticmethod
+    def _bind_enable_toggle(var, widgets, invert=False):
+        """Enable widgets while var is set (cleared when invert=True) and keep them in sync"""
+        def update_state(*args):
+            state = 'normal' if bool(var.get()) != invert else 'disabled'
+            for widget in widgets:
+                widget.configure(state=state)
+        
+        # Set initial state, then follow changes to the checkbox variable
+        update_state()
+        var.trace_add('write', update_state)
+
+    def _build_settings_tab(self, parent, heading, sections, entries, display):
+        """Create one Settings tab from its _SETTINGS_TABS description"""
+        import tkinter as tk
+        from tkinter import ttk
+
+        # Title
+        title_label = ttk.Label(parent, text=heading, 
+                               font=('TkDefaultFont', 10, 'bold'))
+        title_label.pack(anchor=tk.W, pady=(0, 15))
         
-        # Monitor changes to enable_logging_var and call toggle_logging_controls when it changes
-        enable_logging_var.trace('w', toggle_logging_controls)
+        # Widgets enabled/disabled by a checkbox, keyed by their setting
+        toggled = {}
+        for section_title, section_gap, fields in sections:
+            section_frame = ttk.LabelFrame(parent, text=section_title, padding="15")
+            section_frame.pack(fill=tk.X, pady=(0, section_gap))
+            
+            for kind, key, label_text, size, gap in fields:
+                if kind == "entry":
+                    toggled[key] = self._add_entry_row(section_frame, label_text, key, size,
+                                                       entries, display, pady=(0, gap))
+                elif kind == "check":
+                    var = tk.BooleanVar(value=self.config[key])
+                    ttk.Checkbutton(section_frame, text=label_text, 
+                                    variable=var).pack(anchor=tk.W, pady=(0, gap))
+                    entries[key] = var
+                elif kind == "combo":
+                    # Horizontal 'Label: [Combobox]' row
+                    row_frame = ttk.Frame(section_frame)
+                    row_frame.pack(fill=tk.X, pady=(0, gap))
+                    ttk.Label(row_frame, text=label_text).pack(side=tk.LEFT)
+                    var = tk.StringVar(value=self.config[key])
+                    ttk.Combobox(row_frame, textvariable=var, values=size, width=15,
+                                 state="readonly").pack(side=tk.LEFT, padx=(10, 0))
+                    entries[key] = var
+                elif kind == "dir":
+                    width, frame_title, info = size
+                    toggled[key] = self._add_directory_row(section_frame, label_text, key, width,
+                                                           frame_title, info, entries, display,
+                                                           pady=(0, gap))
+        
+        # Only wire up toggles whose checkbox and controls both live on this tab
+        for check_key, key, invert in self._SETTINGS_TOGGLES:
+            if key in toggled and check_key in entries:
+                self._bind_enable_toggle(entries[check_key], toggled[key], invert=invert)
+
+    @staticmethod
+    def _display_text(value):
+        """Text shown in an entry for a config value; strings pass through unchanged"""
+        if type(value) is str:
+            return value
+        return "" if value is None else str(value)
+
+    @staticmethod
+    def _parse_positive_int(text):
+        """Return text as a positive integer, or None if it is not one"""
+        text = text.strip()
+        if text.isdecimal():
+            value = int(text)
+        else:
+            # Only unusual input (signs, underscores, garbage) pays for try/except
+            try:
+                value = int(text)
+            except ValueError:
+                return None
+        return value if value > 0 else None
 
     def _save_changes(self, entries, window, on_save_callback):
         """Save configuration changes"""
+        from tkinter import messagebox
+
         try:
+            # Collect and validate every field first so invalid input never
+            # leaves the config partially updated. Entries, checkbox and
+            # combobox variables all expose get(), so only the integer
+            # settings need converting.
+            new_values = {}
+            errors = []
             for key, widget in entries.items():
-                if isinstance(widget, (tk.BooleanVar, tk.StringVar)):
-                    self.config[key] = widget.get()
-                elif isinstance(widget, ttk.Entry):
-                    val = widget.get()
-                    if key in ["default_preview_percentage", "sample_percentage", 
-                              "max_additional_columns", "insert_batch_size", "large_file_threshold_mb"]:
-                        try:
-                            self.config[key] = int(val)
-                            if self.config[key] < 1:
-                                raise ValueError("Value must be positive")
-                        except ValueError:
-                            messagebox.showerror(
-                                "Invalid Input", 
-                                f"{key.replace('_', ' ').title()} must be a positive integer."
-                            )
-                            return
-                    else:
-                        self.config[key] = val
+                val = widget.get()
+                if key in self._INT_KEYS:
+                    val = self._parse_positive_int(val)
+                    if val is None:
+                        errors.append(f"{key.replace('_', ' ').title()} must be a positive integer.")
+                        continue
+                    limit = self._INT_LIMITS.get(key)
+                    if limit is not None and val > limit:
+                        errors.append(f"{key.replace('_', ' ').title()} must be at most {limit:,}.")
+                        continue
+                new_values[key] = val
+            
+            if errors:
+                messagebox.showerror("Invalid Input", "\n".join(errors))
+                return
             
-            # Ensure insert_batch_size exists
-            if "insert_batch_size" not in self.config:
-                self.config["insert_batch_size"] = 5000
-                
-            # Ensure logging settings exist
-            if "enable_logging" not in self.config:
-                self.config["enable_logging"] = True
-            if "log_directory" not in self.config:
-                self.config["log_directory"] = ""
-                
+            self.config.update(new_values)
             self.save()
             
             # Show success message
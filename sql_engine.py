@@ -1,10 +1,56 @@
 import re
 import os
 import json
+import locale
 import csv
+import codecs
+import functools
+import io
+import itertools
 from collections import defaultdict
 from datetime import datetime
 
+# Buffer size for whole-file reads and script writes; the 8 KiB default
+# means thousands of read()/write() calls on multi-GB inputs
+_IO_BUFFER_SIZE = 1 << 20
+
+def _open_csv(file_path):
+    """Open a delimited file for csv.reader, dropping a UTF-8 byte-order mark if present"""
+    raw = open(file_path, 'rb', buffering=_IO_BUFFER_SIZE)
+    # Without a BOM keep the platform default encoding, as open() would
+    encoding = 'utf-8-sig' if raw.peek(3).startswith(codecs.BOM_UTF8) else None
+    return io.TextIOWrapper(raw, encoding=encoding, newline='')
+
+def _read_rows(f, delimiter):
+    """Yield the rows csv.reader would, splitting lines directly until the first quote"""
+    for line in f:
+        # Quoted fields may hold delimiters or span lines, so hand the rest
+        # of the file to csv.reader, starting at this record boundary
+        if '"' in line:
+            yield from csv.reader(itertools.chain((line,), f), delimiter=delimiter)
+            return
+        line = line.rstrip('\r\n')
+        # csv.reader yields an empty row for a blank line
+        yield line.split(delimiter) if line else []
+
+def _sql_server_codepage(encoding):
+    """Map a Python text encoding to a BULK INSERT CODEPAGE value"""
+    try:
+        name = codecs.lookup(encoding).name
+    except LookupError:
+        # Windows' 'mbcs' is the ANSI code page, which SQL Server calls ACP
+        return 'ACP' if encoding.lower() == 'mbcs' else 'RAW'
+    if name == 'utf-8':
+        return '65001'
+    if name == 'ascii':
+        return '20127'
+    if name.startswith('iso8859-') and name[8:].isdigit():
+        return str(28590 + int(name[8:]))
+    if name.startswith('cp') and name[2:].isdigit():
+        return name[2:]
+    # No known code page: load the bytes unconverted
+    return 'RAW'
+
 class DataCache:
     """Efficient data caching to avoid multiple file reads"""
     def __init__(self):
@@ -16,6 +62,8 @@ class DataCache:
         self.is_large_file = False
         self.chunk_generator = None
         self.file_type = None
+        self.inferred_types = None
+        self.load_key = None
         
     def clear(self):
         """Clear cached data"""
@@ -27,6 +75,8 @@ class DataCache:
         self.is_large_file = False
         self.chunk_generator = None
         self.file_type = None
+        self.inferred_types = None
+        self.load_key = None
         
     def get_file_type(self, file_path):
         """Determine file type based on extension"""
@@ -40,6 +90,11 @@ class DataCache:
         """Load file with smart caching strategy"""
         self.clear()
         
+        # Stat before reading so a write during the load invalidates the cache
+        st = os.stat(file_path)
+        load_key = (file_path, delimiter, sample_percentage, large_file_threshold,
+                    st.st_mtime_ns, st.st_size)
+        
         # Determine file type
         self.file_type = self.get_file_type(file_path)
         
@@ -56,17 +111,24 @@ class DataCache:
             'estimated_rows': getattr(self, 'estimated_rows', len(self.all_rows) if self.all_rows else 0),
             'file_type': self.file_type
         }
+        self.load_key = load_key
         self.is_loaded = True
         
+    def is_current(self, file_path, delimiter, sample_percentage=15, large_file_threshold=50000):
+        """Check whether load_file() already cached this unchanged file with the same settings"""
+        if not self.is_loaded:
+            return False
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return False
+        return self.load_key == (file_path, delimiter, sample_percentage, large_file_threshold,
+                                 st.st_mtime_ns, st.st_size)
+        
     def _load_json_file(self, file_path, sample_percentage, large_file_threshold):
         """Load and process JSON file"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                # First, try to get file size estimate
-                f.seek(0, 2)  # Go to end
-                file_size = f.tell()
-                f.seek(0)  # Go back to start
-                
+            with open(file_path, 'r', encoding='utf-8-sig', buffering=_IO_BUFFER_SIZE) as f:
                 # Load JSON data
                 json_data = json.load(f)
                 
@@ -172,22 +234,17 @@ class DataCache:
         
     def _load_csv_file(self, file_path, delimiter, sample_percentage, large_file_threshold):
         """Load CSV file (original logic)"""
-        # Get file size estimate
-        with open(file_path, 'r', newline='') as f:
-            # Read first few lines to estimate
-            sample_lines = []
-            for i, line in enumerate(f):
-                if i >= 100:
-                    break
-                sample_lines.append(line)
+        # Get file size estimate from the file system rather than seeking
+        # the text reader to the end and back
+        file_size = os.path.getsize(file_path)
+        # Read the first few lines in binary so they are measured in bytes,
+        # the same unit as the file size, whatever the encoding
+        with open(file_path, 'rb') as f:
+            sample_sizes = [len(line) for line in itertools.islice(f, 100)]
             
-            f.seek(0, 2)  # Go to end
-            file_size = f.tell()
-            f.seek(0)  # Go back to start
-            
-            # Estimate total rows
-            avg_line_size = file_size / len(sample_lines) if sample_lines else 100
-            estimated_rows = int(file_size / avg_line_size)
+        # Estimate total rows from the average size of the sampled lines
+        avg_line_size = sum(sample_sizes) / len(sample_sizes) if sample_sizes else 100
+        estimated_rows = int(file_size / avg_line_size)
             
         self.is_large_file = estimated_rows > large_file_threshold
         self.estimated_rows = estimated_rows
@@ -199,8 +256,8 @@ class DataCache:
             
     def _load_small_csv_file(self, file_path, delimiter, sample_percentage):
         """Load entire CSV file for small datasets"""
-        with open(file_path, 'r', newline='') as f:
-            reader = csv.reader(f, delimiter=delimiter)
+        with _open_csv(file_path) as f:
+            reader = _read_rows(f, delimiter)
             self.headers = next(reader)
             self.all_rows = list(reader)
             
@@ -210,10 +267,13 @@ class DataCache:
         
     def _load_large_csv_file(self, file_path, delimiter, sample_percentage, chunk_size=10000):
         """Load only sample for large CSV files"""
+        # The sample is sample_percentage of a chunk_size window, never fewer
+        # than 1000 rows (1500 at the default 15%), not a share of the whole
+        # file, so memory stays bounded however large the file is
         sample_target = max(1000, int(chunk_size * sample_percentage / 100))
         
-        with open(file_path, 'r', newline='') as f:
-            reader = csv.reader(f, delimiter=delimiter)
+        with _open_csv(file_path) as f:
+            reader = _read_rows(f, delimiter)
             self.headers = next(reader)
             
             # Load sample for type inference and preview
@@ -239,18 +299,25 @@ class DataCache:
                 yield self.all_rows[i:i + chunk_size]
         else:
             # For large CSV files, read chunks from file
-            with open(self.file_info['file_path'], 'r', newline='') as f:
-                reader = csv.reader(f, delimiter=self.file_info['delimiter'])
+            row_count = 0
+            with _open_csv(self.file_info['file_path']) as f:
+                reader = _read_rows(f, self.file_info['delimiter'])
                 next(reader)  # Skip headers
                 
                 chunk = []
                 for row in reader:
                     chunk.append(row)
                     if len(chunk) >= chunk_size:
+                        row_count += len(chunk)
                         yield chunk
                         chunk = []
                 if chunk:  # Yield remaining rows
+                    row_count += len(chunk)
                     yield chunk
+            
+            # Loading only estimated the row count; a complete pass knows it exactly
+            self.estimated_rows = row_count
+            self.file_info['total_rows'] = self.file_info['estimated_rows'] = row_count
 
 class OptimizedTypeInferrer:
     """Optimized type inference with regex patterns and statistical sampling"""
@@ -258,12 +325,9 @@ class OptimizedTypeInferrer:
         # Compile regex patterns once for reuse
         self.int_pattern = re.compile(r'^-?\d+$')
         self.float_pattern = re.compile(r'^-?\d*\.\d+$')
-        self.date_patterns = [
-            re.compile(r'^\d{4}-\d{2}-\d{2}$'),  # YYYY-MM-DD
-            re.compile(r'^\d{2}/\d{2}/\d{4}$'),  # MM/DD/YYYY
-            re.compile(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$'),  # datetime
-            re.compile(r'^\d{2}-\d{2}-\d{4}$'),  # DD-MM-YYYY
-        ]
+        # YYYY-MM-DD, optionally with HH:MM:SS, MM/DD/YYYY or DD-MM-YYYY
+        self.date_pattern = re.compile(
+            r'^(?:\d{4}-\d{2}-\d{2}(?: \d{2}:\d{2}:\d{2})?|\d{2}/\d{2}/\d{4}|\d{2}-\d{2}-\d{4})$')
     
     def infer_column_types(self, sample_rows, headers, max_sample=1000):
         """Efficiently infer types using statistical sampling"""
@@ -278,14 +342,12 @@ class OptimizedTypeInferrer:
         type_votes = [defaultdict(int) for _ in range(column_count)]
         max_lengths = [0] * column_count
         
+        column_indexes = range(column_count)
         for row in sample_data:
-            # Pad row if necessary
-            padded_row = row + [''] * (column_count - len(row))
-            
-            for col_idx, value in enumerate(padded_row[:column_count]):
-                if col_idx >= len(type_votes):
-                    continue
-                    
+            # Missing trailing cells would only count as empty values, which
+            # are skipped anyway, so short rows need no padding and extra
+            # cells are cut off by zip
+            for col_idx, value in zip(column_indexes, row):
                 value = str(value).strip()
                 max_lengths[col_idx] = max(max_lengths[col_idx], len(value))
                 
@@ -293,13 +355,20 @@ class OptimizedTypeInferrer:
                     continue
                 
                 # Quick type checks using compiled patterns
+                first = value[0]
                 if value.lower() in ('0', '1', 'true', 'false'):
                     type_votes[col_idx]['BIT'] += 1
-                elif self.int_pattern.match(value):
+                # Numbers and dates all start with a digit, '-' or '.', so
+                # any other text is VARCHAR without trying the patterns
+                elif not (first.isdecimal() or first == '-' or first == '.'):
+                    type_votes[col_idx]['VARCHAR'] += 1
+                # isdecimal() accepts exactly what int_pattern matches, minus the regex call
+                elif (value[1:] if first == '-' else value).isdecimal():
                     type_votes[col_idx]['INT'] += 1
                 elif self.float_pattern.match(value):
                     type_votes[col_idx]['FLOAT'] += 1
-                elif any(pattern.match(value) for pattern in self.date_patterns):
+                # Every date format is exactly 10 or 19 characters long
+                elif len(value) in (10, 19) and self.date_pattern.match(value):
                     type_votes[col_idx]['DATETIME'] += 1
                 else:
                     type_votes[col_idx]['VARCHAR'] += 1
@@ -333,49 +402,108 @@ class OptimizedTypeInferrer:
         
         return inferred_types
 
+# SQL Server rejects an INSERT ... VALUES list with more than 1000 row constructors
+MAX_INSERT_ROWS = 1000
+
+# SQL types whose values are written without quotes
+_UNQUOTED_TYPES = frozenset({'INT', 'INTEGER', 'FLOAT', 'BIT', 'DECIMAL', 'NUMERIC', 'REAL',
+                             'SMALLINT', 'TINYINT', 'BIGINT'})
+_LEADING_WORD = re.compile(r'\s*([A-Za-z]*)')
+
+# Column name tokenizing for format_column_name: separators, then
+# capitalized/lowercase words and all-caps runs (e.g. "ID" in "userID")
+_NAME_SEPARATORS = re.compile(r'[\s_\-]+')
+_NAME_WORDS = re.compile(r'[A-Z]?[a-z]+|[A-Z]+(?=[A-Z]|$)')
+_NAME_STYLES = frozenset({"snake_case", "CamelCase", "lowercase", "UPPERCASE"})
+
+# Per-column value formatting actions produced by SQLGenerator.compile_column_plan
+_SKIP, _QUOTED, _RAW, _GUID_QUOTED, _GUID_RAW = range(5)
+
 class SQLGenerator:
     """Core logic for generating SQL statements and formatting names"""
     
     @staticmethod
     def is_quoted_type(sql_type: str) -> bool:
-        sql_type_upper = sql_type.strip().upper()
-        unquoted_keywords = ['INT', 'FLOAT', 'BIT', 'DECIMAL', 'NUMERIC', 'REAL', 'SMALLINT', 'TINYINT', 'BIGINT']
-        for keyword in unquoted_keywords:
-            if sql_type_upper.startswith(keyword):
-                return False
-        return True
+        # Only the base type name matters, e.g. DECIMAL in "decimal(10, 2)"
+        base_type = _LEADING_WORD.match(sql_type).group(1).upper()
+        return base_type not in _UNQUOTED_TYPES
 
     @staticmethod
-    def format_insert_values(row, column_types):
-        formatted_values = []
-        for val, sql_type in zip(row, column_types):
+    def compile_column_plan(column_types):
+        """Classify each column type once into the action used to format its values"""
+        plan = []
+        for sql_type in column_types:
             sql_type_upper = sql_type.strip().upper()
+            quoted = SQLGenerator.is_quoted_type(sql_type)
             if 'INT IDENTITY' in sql_type_upper:
-                continue  # Skip values for INT IDENTITY
-            elif 'UNIQUEIDENTIFIER' in sql_type_upper and val.strip() == '':
-                formatted_values.append('NEWID()')
-            elif val == '':
-                formatted_values.append('NULL')
-            elif SQLGenerator.is_quoted_type(sql_type):
-                escaped_val = val.replace("'", "''")
-                formatted_values.append(f"'{escaped_val}'")
+                plan.append(_SKIP)  # Skip values for INT IDENTITY
+            elif 'UNIQUEIDENTIFIER' in sql_type_upper:
+                plan.append(_GUID_QUOTED if quoted else _GUID_RAW)
+            else:
+                plan.append(_QUOTED if quoted else _RAW)
+        return plan
+
+    @staticmethod
+    def format_planned_values(row, plan):
+        """Format one row as a VALUES tuple using a plan from compile_column_plan"""
+        formatted_values = []
+        append = formatted_values.append
+        for val, action in zip(row, plan):
+            if action == _QUOTED:
+                if val == '':
+                    append('NULL')
+                elif "'" in val:
+                    escaped_val = val.replace("'", "''")
+                    append(f"'{escaped_val}'")
+                else:
+                    append(f"'{val}'")
+            elif action == _RAW:
+                append(val if val != '' else 'NULL')
+            elif action == _SKIP:
+                continue
+            elif val.strip() == '':
+                append('NEWID()')
+            elif action == _GUID_QUOTED:
+                if "'" in val:
+                    val = val.replace("'", "''")
+                append(f"'{val}'")
             else:
-                formatted_values.append(val)
+                append(val)
         return f"    ({', '.join(formatted_values)})"
 
     @staticmethod
+    def format_insert_values(row, column_types):
+        return SQLGenerator.format_planned_values(row, SQLGenerator.compile_column_plan(column_types))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def format_column_name(name: str, style: str) -> str:
-        parts = re.split(r'[\s_\-]+', name)
-        parts = [word for part in parts for word in re.findall(r'[A-Z]?[a-z]+|[A-Z]+(?=[A-Z]|$)', part)]
+        if style not in _NAME_STYLES:
+            return name
+        # Names that already conform come back unchanged, so skip tokenizing them
+        if name.isascii():
+            if style == "snake_case":
+                if name.islower() and all(word.isalpha() for word in name.split("_")):
+                    return name
+            elif style == "lowercase":
+                if name.isalpha() and name.islower():
+                    return name
+            elif style == "UPPERCASE":
+                if name.isalpha() and name.isupper():
+                    return name
+        parts = _NAME_SEPARATORS.split(name)
+        parts = [word for part in parts for word in _NAME_WORDS.findall(part)]
         parts = [p for p in parts if p]
+        # Words are ASCII-only (see _NAME_WORDS), so casing the joined name
+        # once gives the same result as casing every word
         if style == "snake_case":
-            return "_".join(p.lower() for p in parts)
+            return "_".join(parts).lower()
         elif style == "CamelCase":
-            return "".join(p.capitalize() for p in parts)
+            return "".join([p.capitalize() for p in parts])
         elif style == "lowercase":
-            return "".join(p.lower() for p in parts)
+            return "".join(parts).lower()
         elif style == "UPPERCASE":
-            return "".join(p.upper() for p in parts)
+            return "".join(parts).upper()
         else:
             return name
 
@@ -395,10 +523,13 @@ class SQLGenerator:
         create_lines.append(f"CREATE TABLE {full_table} (")
 
         pk_columns = []
+        # Every column needs a trailing comma when a PK constraint follows
+        has_pk = any(c['is_pk'] for c in columns)
+        last_index = len(columns) - 1
         for i, col in enumerate(columns):
             null_str = "NULL" if col['allows_null'] else "NOT NULL"
             column_def = f"    [{col['name']}] {col['type']} {null_str}"
-            if i < len(columns) - 1 or any(c['is_pk'] for c in columns):
+            if i < last_index or has_pk:
                 column_def += ","
             create_lines.append(column_def)
             if col['is_pk']:
@@ -438,64 +569,143 @@ class SQLGenerator:
         if progress_callback:
             progress_callback("Reading and processing data...")
             
-        # Process data in chunks
-        all_values = []
-        chunk_count = 0
-        total_rows_processed = 0
-        
-        for chunk in data_cache.get_chunk_generator():
-            if cancel_check and cancel_check():
-                return None
-                
-            chunk_count += 1
-            if progress_callback:
-                progress_callback(f"Processing data chunk {chunk_count}...")
-            
-            for row in chunk:
-                # Pad row if necessary
-                extra_count = len(column_types) - len(row)
-                if extra_count > 0:
-                    row = [''] * extra_count + row
-                all_values.append(SQLGenerator.format_insert_values(row, column_types))
-                total_rows_processed += 1
-                
-                if total_rows_processed % 5000 == 0 and progress_callback:
-                    progress_callback(f"Processed {total_rows_processed:,} rows...")
-        
-        if cancel_check and cancel_check():
-            return None
+        # Stream statements straight to a sibling temp file so memory stays
+        # bounded by one chunk; it only replaces file_path once complete
+        tmp_path = file_path + '.tmp'
+        f = open(tmp_path, 'w', encoding='utf-8', buffering=_IO_BUFFER_SIZE)
+        try:
+            write = f.write
+            prelude = "\n".join(script_lines)
+            write(prelude)
+            # Every statement after the prelude starts on a new line
+            separator = "\n" if script_lines else ""
             
-        if progress_callback:
-            progress_callback(f"Generating SQL script for {total_rows_processed:,} rows...")
-        
-        if batch_insert:
+            # SQL Server accepts at most MAX_INSERT_ROWS rows per VALUES list.
+            # Batches end in GO; without batching the statements are split
+            # the same way but all run in a single GO batch.
+            if batch_insert:
+                batch_size = min(batch_size, MAX_INSERT_ROWS)
+                statement_end = ";\nGO"
+            else:
+                batch_size = MAX_INSERT_ROWS
+                statement_end = ";"
+            chunk_count = 0
             batch_count = 0
-            total_batches = (len(all_values) + batch_size - 1) // batch_size
+            batch_rows = 0
+            total_rows_processed = 0
+            column_count = len(column_types)
+            # Column types are constant, so classify them once up front
+            plan = SQLGenerator.compile_column_plan(column_types)
             
-            for i in range(0, len(all_values), batch_size):
+            for chunk in data_cache.get_chunk_generator():
                 if cancel_check and cancel_check():
+                    f.close()
+                    os.remove(tmp_path)
                     return None
                     
-                batch_count += 1
+                chunk_count += 1
                 if progress_callback:
-                    progress_callback(f"Creating batch {batch_count} of {total_batches}...")
+                    progress_callback(f"Processing data chunk {chunk_count}...")
                 
-                chunk = all_values[i:i + batch_size]
-                script_lines.append(insert_header)
-                script_lines.append(",\n".join(chunk) + ";\nGO")
+                for row in chunk:
+                    # Pad row if necessary
+                    extra_count = column_count - len(row)
+                    if extra_count > 0:
+                        row = [''] * extra_count + row
+                    values = SQLGenerator.format_planned_values(row, plan)
+                    
+                    if batch_rows == 0:
+                        batch_count += 1
+                        if batch_insert and progress_callback:
+                            progress_callback(f"Creating batch {batch_count}...")
+                        write(f"{separator}{insert_header}\n{values}")
+                        separator = "\n"
+                    else:
+                        write(f",\n{values}")
+                    batch_rows += 1
+                    if batch_rows == batch_size:
+                        write(statement_end)
+                        batch_rows = 0
+                    total_rows_processed += 1
+                    
+                    if total_rows_processed % 5000 == 0 and progress_callback:
+                        progress_callback(f"Processed {total_rows_processed:,} rows...")
+            
+            if cancel_check and cancel_check():
+                f.close()
+                os.remove(tmp_path)
+                return None
+            
+            # Close the open batch; a single INSERT is emitted even with no rows
+            if batch_rows:
+                write(";\nGO")
+            elif not batch_insert:
+                if total_rows_processed == 0:
+                    write(f"{separator}{insert_header}\n;\nGO")
+                else:
+                    # The last statement filled up exactly; close the GO batch
+                    write("\nGO")
+            
+            if progress_callback:
+                progress_callback("Saving file to disk...")
+            f.close()
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            f.close()
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+            
+        return total_rows_processed
+
+    @staticmethod
+    def generate_bulk_insert_script(file_path, table_name, schema_name, db_name, source_path, delimiter,
+                                    truncate_before_insert):
+        """
+        Writes a BULK INSERT script that has SQL Server load the source CSV directly.
+        source_path must be readable by the SQL Server service account.
+        """
+        full_table = f"[{schema_name}].[{table_name}]"
+        script_lines = []
+
+        if db_name:
+            script_lines.append(f"USE [{db_name}];")
+            script_lines.append("GO")
+            script_lines.append("")
+
+        if truncate_before_insert:
+            script_lines.append(f"TRUNCATE TABLE {full_table};")
+            script_lines.append("GO")
+            script_lines.append("")
+
+        # SQL Server reads a '\n' row terminator as CRLF, so LF-only files
+        # need the terminator spelled out as a hex byte
+        with open(source_path, 'rb') as f:
+            head = f.read(65536)
+        row_terminator = "\\n" if b'\r\n' in head else "0x0a"
+        # Have the server decode the file the way _open_csv reads it:
+        # UTF-8 when it starts with a BOM, otherwise the platform default
+        if head.startswith(codecs.BOM_UTF8):
+            codepage = '65001'
         else:
-            script_lines.append(insert_header)
-            script_lines.append(",\n".join(all_values) + ";\nGO")
+            codepage = _sql_server_codepage(locale.getpreferredencoding(False))
+        field_terminator = "\\t" if delimiter == "\t" else delimiter.replace("'", "''")
+        source_literal = source_path.replace("'", "''")
+
+        script_lines.append(f"BULK INSERT {full_table}")
+        script_lines.append(f"FROM '{source_literal}'")
+        script_lines.append("WITH (")
+        script_lines.append("    FORMAT = 'CSV',")
+        script_lines.append(f"    CODEPAGE = '{codepage}',")
+        script_lines.append("    FIRSTROW = 2,")
+        script_lines.append(f"    FIELDTERMINATOR = '{field_terminator}',")
+        script_lines.append(f"    ROWTERMINATOR = '{row_terminator}',")
+        script_lines.append("    TABLOCK")
+        script_lines.append(");")
+        script_lines.append("GO")
 
-        script = "\n".join(script_lines)
-        
-        if progress_callback:
-            progress_callback("Saving file to disk...")
-        
         with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(script)
-            
-        return total_rows_processed
+            f.write("\n".join(script_lines))
 
     @staticmethod
     def write_operation_log(log_data, enable_logging, log_directory):
@@ -585,7 +795,8 @@ class SQLGenerator:
                     log_file.write(f"  File: {log_data.get('insert_script_name', 'N/A')}\n")
                     log_file.write(f"  Path: {log_data.get('insert_script_path', 'N/A')}\n")
                     log_file.write(f"  Size: {log_data.get('insert_script_size', 'N/A')}\n")
-                    log_file.write(f"  Rows Processed: {log_data.get('insert_rows_processed', 'N/A'):,}\n")
+                    if not log_data.get('bulk_insert_enabled'):
+                        log_file.write(f"  Rows Processed: {log_data.get('insert_rows_processed', 'N/A'):,}\n")
                 else:
                     log_file.write("✗ INSERT statements not generated\n")
                 
@@ -597,6 +808,8 @@ class SQLGenerator:
                 log_file.write(f"Data Type Inference: {'Enabled' if log_data.get('type_inference_enabled') else 'Disabled'}\n")
                 log_file.write(f"Column Format: {log_data.get('column_format', 'N/A')}\n")
                 if log_data.get('insert_script_generated'):
+                    if log_data.get('bulk_insert_enabled'):
+                        log_file.write("Bulk Insert: Enabled\n")
                     log_file.write(f"Batch Insert: {'Enabled' if log_data.get('batch_insert_enabled') else 'Disabled'}\n")
                     if log_data.get('batch_insert_enabled'):
                         log_file.write(f"Batch Size: {log_data.get('batch_size', 'N/A'):,}\n")
@@ -609,7 +822,9 @@ class SQLGenerator:
                 source_rows = log_data.get('source_total_rows', 0)
                 processed_rows = log_data.get('insert_rows_processed', 0)
                 
-                if log_data.get('insert_script_generated'):
+                if log_data.get('bulk_insert_enabled') and log_data.get('insert_script_generated'):
+                    log_file.write("- Row count validation not applicable (rows are loaded by SQL Server)\n")
+                elif log_data.get('insert_script_generated'):
                     if source_rows == processed_rows:
                         log_file.write("✓ Row count validation PASSED\n")
                         log_file.write(f"  Source rows: {source_rows:,}\n")
@@ -1,18 +1,14 @@
 from config_manager import ConfigManager
-from sql_engine import DataCache, OptimizedTypeInferrer, SQLGenerator
+from sql_engine import DataCache, OptimizedTypeInferrer, SQLGenerator, MAX_INSERT_ROWS
 from concurrent.futures import ThreadPoolExecutor
+import csv
+import queue
 import time
 import tkinter as tk
 from tkinter import ttk
 from tkinter import filedialog, messagebox
-import sys
 import os
-
-def resource_path(filename):
-    """ Get absolute path to resource, works for dev and for PyInstaller bundle """
-    if hasattr(sys, '_MEIPASS'):
-        return os.path.join(sys._MEIPASS, filename)
-    return os.path.join(os.path.abspath("."), filename)
+import webbrowser
 
 class ProgressWindow:
     """Progress dialog for long-running operations"""
@@ -61,11 +57,44 @@ class ProgressWindow:
         self.cancel_button.pack(pady=10)
         
         self.cancelled = False
+        self.closed = False
+        # Closing with the title bar button cancels the task like the Cancel button
+        self.window.protocol("WM_DELETE_WINDOW", self.cancel)
+        
+        # Status texts posted by worker threads, shown from the Tk thread
+        self.messages = queue.Queue()
+        self.poll_id = self.window.after(50, self.poll_messages)
         
     def update_text(self, text):
+        # A direct update supersedes anything a worker posted before it
+        self.next_message()
         self.label.config(text=text)
         self.window.update()
         
+    def post_text(self, text):
+        """Thread-safe status update; the label changes on the next poll"""
+        self.messages.put(text)
+        
+    def next_message(self):
+        """Drain the posted texts and return the newest, or None"""
+        text = None
+        try:
+            while True:
+                text = self.messages.get_nowait()
+        except queue.Empty:
+            pass
+        return text
+        
+    def poll_messages(self):
+        # Stop polling once the dialog is gone
+        if self.closed or not self.window.winfo_exists():
+            return
+        # Only the newest text is visible, so skip the ones it replaces
+        text = self.next_message()
+        if text is not None:
+            self.label.config(text=text)
+        self.poll_id = self.window.after(50, self.poll_messages)
+        
     def set_progress(self, value, maximum=100):
         self.progress.config(mode='determinate', maximum=maximum, value=value)
         self.window.update()
@@ -94,6 +123,10 @@ class ProgressWindow:
         self.close()
         
     def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        self.window.after_cancel(self.poll_id)
         self.progress.stop()
         self.window.destroy()
 
@@ -102,10 +135,15 @@ class SQLTableBuilder:
         self.master = master
         self.master.title("SQL Table Builder Pro")
         self.master.geometry("750x500")  
+        
+        # Read the settings first so every Tk variable is created once with its final value
+        self.config_mgr = ConfigManager()
+        cfg = self.config_mgr.config
+        
         self.file_path = tk.StringVar()
         self.delimiter = tk.StringVar()
         self.table_name = tk.StringVar()
-        self.schema_name = tk.StringVar(value="dbo")
+        self.schema_name = tk.StringVar(value=cfg["default_schema"])
         self.headers = []
         self.original_headers = []  # Store original headers for "Source File" reset
         self.column_entries = []
@@ -115,9 +153,9 @@ class SQLTableBuilder:
         self.null_vars = []
         self.null_checkboxes = []
         self.database_name = tk.StringVar()
-        self.infer_types_var = tk.BooleanVar(value=True)
-        self.include_create_script = tk.BooleanVar(value=True)
-        self.include_insert_script = tk.BooleanVar(value=True)
+        self.infer_types_var = tk.BooleanVar(value=cfg["default_infer_types"])
+        self.include_create_script = tk.BooleanVar(value=cfg["default_include_create"])
+        self.include_insert_script = tk.BooleanVar(value=cfg["default_include_insert"])
         
         # Initialize optimized components from engine
         self.data_cache = DataCache()
@@ -127,18 +165,13 @@ class SQLTableBuilder:
         # Configure button styling
         self.setup_button_styles()
         
-        self.config_mgr = ConfigManager()
-        cfg = self.config_mgr.config
         self.additional_column_count = 0
         self.max_additional_columns = int(cfg.get("max_additional_columns", 1))
-        self.schema_name.set(cfg["default_schema"])
         self.preview_percentage_var = tk.StringVar(value=str(cfg["default_preview_percentage"]))
-        self.include_create_script = tk.BooleanVar(value=cfg["default_include_create"])
-        self.include_insert_script = tk.BooleanVar(value=cfg["default_include_insert"])
         self.batch_insert_var = tk.BooleanVar(value=cfg.get("default_batch_insert", True))
-        self.insert_batch_size = int(cfg.get("insert_batch_size") or 500)
+        self.bulk_insert_var = tk.BooleanVar(value=False)
+        self.insert_batch_size = min(int(cfg.get("insert_batch_size") or MAX_INSERT_ROWS), MAX_INSERT_ROWS)
         self.truncate_before_insert = tk.BooleanVar()
-        self.infer_types_var = tk.BooleanVar(value=cfg["default_infer_types"])
         self.sample_percentage = cfg["sample_percentage"]
         
         # New table name configuration settings
@@ -151,8 +184,12 @@ class SQLTableBuilder:
         # NEW: Large file threshold setting
         self.large_file_threshold_mb = cfg.get("large_file_threshold_mb", 1000)
         
-        # Initialize large file indicator widget
+        # Initialize large file indicator widget and the row it is shown on
         self.large_file_indicator = None
+        self.preview_controls_row = None
+        
+        # (tree, stats label, info label, headers) of the current data preview
+        self.preview_widgets = None
 
         self.apply_config_settings()
 
@@ -291,42 +328,28 @@ class SQLTableBuilder:
         
         # Show indicator if file exceeds threshold
         if size_mb >= self.large_file_threshold_mb:
-            # Find the preview frame to add the indicator to
+            # The indicator lives on the preview controls row of the file selection screen
             try:
-                # Look for the preview_frame (which contains the preview controls)
-                for widget in self.master.winfo_children():
-                    if isinstance(widget, tk.Frame):
-                        for child in widget.winfo_children():
-                            if isinstance(child, tk.LabelFrame) and "Select Source File" in child.cget('text'):
-                                # Find the preview controls frame within the file group
-                                for subchild in child.winfo_children():
-                                    if isinstance(subchild, tk.Frame):
-                                        # Check if this frame contains preview controls
-                                        frame_children = subchild.winfo_children()
-                                        if len(frame_children) > 0:
-                                            # Look for a frame that contains preview controls
-                                            for frame_child in frame_children:
-                                                if isinstance(frame_child, tk.Frame):
-                                                    # This should be the preview_controls frame
-                                                    preview_controls_parent = subchild
-                                                    
-                                                    # Create the large file indicator
-                                                    size_text = self.format_file_size(size_mb)
-                                                    indicator_text = f"⚠️ Large File ({size_text})"
-                                                    
-                                                    self.large_file_indicator = tk.Label(
-                                                        preview_controls_parent, 
-                                                        text=indicator_text,
-                                                        font=('Arial', 8), 
-                                                        bg='#D1ECF1',  # Light blue background
-                                                        fg='#0C5460',  # Dark blue text
-                                                        relief='solid', 
-                                                        bd=1, 
-                                                        padx=6, 
-                                                        pady=2
-                                                    )
-                                                    self.large_file_indicator.pack(side='right', padx=10, pady=6)
-                                                    return
+                preview_controls_parent = self.preview_controls_row
+                if preview_controls_parent is None or not preview_controls_parent.winfo_exists():
+                    return
+                
+                # Create the large file indicator
+                size_text = self.format_file_size(size_mb)
+                indicator_text = f"⚠️ Large File ({size_text})"
+                
+                self.large_file_indicator = tk.Label(
+                    preview_controls_parent, 
+                    text=indicator_text,
+                    font=('Arial', 8), 
+                    bg='#D1ECF1',  # Light blue background
+                    fg='#0C5460',  # Dark blue text
+                    relief='solid', 
+                    bd=1, 
+                    padx=6, 
+                    pady=2
+                )
+                self.large_file_indicator.pack(side='right', padx=10, pady=6)
             except Exception as e:
                 print(f"Error creating large file indicator: {e}")
   
@@ -395,6 +418,7 @@ class SQLTableBuilder:
         # Preview controls row (removed delimiter controls)
         preview_frame = tk.Frame(file_group)
         preview_frame.pack(fill="x", pady=(10, 10))
+        self.preview_controls_row = preview_frame
         
         # Preview controls (moved to left side since delimiter controls are removed)
         preview_controls = tk.Frame(preview_frame)
@@ -412,7 +436,7 @@ class SQLTableBuilder:
                                      command=self.on_apply_preview_percentage)
         self.show_button.pack(side="left", padx=(8, 0))
         
-        # Note: Large file indicator will be added dynamically to preview_frame
+        # Note: Large file indicator will be added dynamically to preview_controls_row
                 
         # Action button
         self.preview_frame = tk.LabelFrame(main_frame, text="Data Preview", padx=5, pady=5)
@@ -496,13 +520,23 @@ class SQLTableBuilder:
             self.table_name.set(self.custom_table_name)
 
     def infer_delimiter(self):
-        possible_delimiters = [',', '|', '\t', ';', ':', '^']
+        possible_delimiters = ',|\t;:^'
         try:
-            with open(self.file_path.get(), 'r') as f:
-                sample = f.readline()
-                counts = {delim: sample.count(delim.replace('\t', '\t')) for delim in possible_delimiters}
-                likely_delim = max(counts, key=counts.get)
-                self.delimiter.set(likely_delim if likely_delim != '\t' else '\\t')
+            # Sniff a block of whole lines rather than just the header, so a
+            # header that happens to contain commas cannot decide alone.
+            # Delimiters are ASCII, so latin-1 decodes any sample safely.
+            with open(self.file_path.get(), 'rb') as f:
+                block = f.read(65536)
+            if len(block) == 65536 and b'\n' in block:
+                block = block[:block.rindex(b'\n') + 1]
+            sample = block.decode('latin-1')
+            try:
+                likely_delim = csv.Sniffer().sniff(sample, delimiters=possible_delimiters).delimiter
+            except csv.Error:
+                # Fall back to the most frequent candidate in the first line
+                first_line = sample.split('\n', 1)[0]
+                likely_delim = max(possible_delimiters, key=first_line.count)
+            self.delimiter.set(likely_delim if likely_delim != '\t' else '\\t')
         except Exception as e:
             self.delimiter.set(',')
 
@@ -539,7 +573,7 @@ class SQLTableBuilder:
         
         def load_file_task():
             try:
-                progress.update_text("Reading file structure...")
+                progress.post_text("Reading file structure...")
                 
                 delimiter_val = self.delimiter.get()
                 # Only process delimiter for non-JSON files
@@ -548,9 +582,10 @@ class SQLTableBuilder:
                 else:
                     delimiter_val = None  # Not used for JSON
                 
-                # Load file into cache
-                progress.update_text("Loading data into cache...")
-                self.data_cache.load_file(path, delimiter_val, self.sample_percentage)
+                # Load file into cache, unless the preview already loaded it
+                if not self.data_cache.is_current(path, delimiter_val, self.sample_percentage):
+                    progress.post_text("Loading data into cache...")
+                    self.data_cache.load_file(path, delimiter_val, self.sample_percentage)
                 
                 if progress.cancelled:
                     return
@@ -559,9 +594,6 @@ class SQLTableBuilder:
                 # Store original headers for "Source File" reset functionality
                 self.original_headers = self.headers.copy()
                 
-                progress.update_text("Processing complete!")
-                time.sleep(0.5)  # Brief pause to show completion
-                
                 # Schedule UI update on main thread
                 self.master.after(0, lambda: [progress.close(), self.build_column_type_screen()])
                 
@@ -569,7 +601,7 @@ class SQLTableBuilder:
                 self.master.after(0, lambda: [progress.close(), messagebox.showerror("Error", f"Failed to process file: {e}")])
         
         # Run file loading in background thread
-        self.executor.submit(load_file_task)
+        self.run_in_background(load_file_task)
       
     def build_column_type_screen(self):
         self.additional_column_count = 0
@@ -688,6 +720,9 @@ class SQLTableBuilder:
             type_combo.bind("<<ComboboxSelected>>", lambda e, idx=index: self.enable_reset_button(idx))
             type_combo.bind("<KeyRelease>", lambda e, idx=index: self.enable_reset_button(idx))
             type_combo.bind("<Button-1>", lambda e, idx=index: self.enable_reset_button(idx))
+            # Some types rule out BULK INSERT, so recheck it whenever a type changes
+            type_combo.bind("<<ComboboxSelected>>", self.update_truncate_enable_state, add="+")
+            type_combo.bind("<KeyRelease>", self.update_truncate_enable_state, add="+")
 
             null_checkbox = tk.Checkbutton(row, variable=null_var, command=lambda idx=index: self.update_null_states(idx))
             null_checkbox.pack(side="left")
@@ -720,6 +755,8 @@ class SQLTableBuilder:
         self.batch_insert_check.pack(side="left", padx=5)
         self.truncate_check = tk.Checkbutton(checkbox_row, text="TRUNCATE", variable=self.truncate_before_insert, command=self.update_truncate_color)
         self.truncate_check.pack(side="left", padx=10)
+        self.bulk_insert_check = tk.Checkbutton(checkbox_row, text="BULK INSERT", variable=self.bulk_insert_var, command=self.update_truncate_enable_state)
+        self.bulk_insert_check.pack(side="left", padx=5)
         
         # File info display (rows count) - positioned beneath Batch INSERT
         if self.data_cache.is_loaded:
@@ -790,7 +827,8 @@ class SQLTableBuilder:
             'column_count': len(self.column_entries),
             'type_inference_enabled': self.infer_types_var.get(),
             'column_format': self.naming_style_var.get() if hasattr(self, 'naming_style_var') else 'Source File',
-            'batch_insert_enabled': self.batch_insert_var.get(),
+            'batch_insert_enabled': self.batch_insert_var.get() and not self.use_bulk_insert(),
+            'bulk_insert_enabled': self.use_bulk_insert(),
             'batch_size': self.insert_batch_size,
             'truncate_enabled': self.truncate_before_insert.get(),
             'create_script_generated': False,
@@ -959,18 +997,37 @@ class SQLTableBuilder:
         else:
             self.truncate_check.config(fg="black")
     
+    def use_bulk_insert(self):
+        """BULK INSERT has SQL Server read the source file itself, so it only applies to CSV input"""
+        return (self.bulk_insert_var.get() and self.data_cache.file_type == 'csv'
+                and self.bulk_insert_matches_source())
+
+    def bulk_insert_matches_source(self):
+        """BULK INSERT loads the file's fields by position, so the table must mirror the source header"""
+        # Added columns have no source field to load from
+        if len(self.type_entries) != len(self.headers):
+            return False
+        for type_entry in self.type_entries:
+            col_type = type_entry.get().strip().upper()
+            # INT IDENTITY columns are excluded from the load, and empty
+            # UNIQUEIDENTIFIER values need NEWID(), which only INSERT provides
+            if "INT IDENTITY" in col_type or "UNIQUEIDENTIFIER" in col_type:
+                return False
+        return True
+
     def update_truncate_enable_state(self, *args):
         try:
-            if not self.include_insert_script.get():
-                if self.truncate_check.winfo_exists():
-                    self.truncate_check.config(state="disabled")
-                if self.batch_insert_check.winfo_exists():
-                    self.batch_insert_check.config(state="disabled")
-            else:
-                if self.truncate_check.winfo_exists():
-                    self.truncate_check.config(state="normal")
-                if self.batch_insert_check.winfo_exists():
-                    self.batch_insert_check.config(state="normal")
+            insert_state = "normal" if self.include_insert_script.get() else "disabled"
+            # BULK INSERT loads the CSV by position, so the table has to mirror it
+            bulk_usable = self.data_cache.file_type == 'csv' and self.bulk_insert_matches_source()
+            bulk_state = insert_state if bulk_usable else "disabled"
+            # Batching has no effect when the server loads the file in bulk
+            batch_state = "disabled" if self.use_bulk_insert() else insert_state
+            for check, state in ((self.truncate_check, insert_state),
+                                 (self.batch_insert_check, batch_state),
+                                 (self.bulk_insert_check, bulk_state)):
+                if check.winfo_exists():
+                    check.config(state=state)
         except AttributeError:
             pass
 
@@ -1029,8 +1086,16 @@ class SQLTableBuilder:
                 col_names.append(col_name)
                 column_types.append(col_type)
 
+        use_bulk_insert = self.use_bulk_insert()
+        if self.bulk_insert_var.get() and self.data_cache.file_type == 'csv' and not use_bulk_insert:
+            messagebox.showwarning(
+                "BULK INSERT Unavailable",
+                "BULK INSERT loads the file's columns by position, so the table must match the "
+                "source file: no added columns and no INT IDENTITY or UNIQUEIDENTIFIER types.\n\n"
+                "INSERT statements will be generated instead.")
+
         # Get save location first
-        default_filename = f"insert_into_{table_name}.sql"
+        default_filename = f"{'bulk_insert' if use_bulk_insert else 'insert_into'}_{table_name}.sql"
         file_path = filedialog.asksaveasfilename(defaultextension=".sql", initialfile=default_filename, filetypes=[("SQL Files", "*.sql")])
         if not file_path:
             # Call log callback even if user cancels
@@ -1046,16 +1111,25 @@ class SQLTableBuilder:
                 db_name = self.database_name.get().strip()
                 
                 def progress_cb(text):
-                    self.master.after(0, lambda: progress.update_text(text))
+                    progress.post_text(text)
                 
                 def cancel_check():
                     return progress.cancelled
 
-                total_rows_processed = SQLGenerator.generate_insert_script(
-                    file_path, table_name, schema_name, db_name, col_names, column_types,
-                    self.data_cache, self.batch_insert_var.get(), self.insert_batch_size,
-                    self.truncate_before_insert.get(), progress_cb, cancel_check
-                )
+                if use_bulk_insert:
+                    delimiter_val = self.data_cache.file_info['delimiter']
+                    SQLGenerator.generate_bulk_insert_script(
+                        file_path, table_name, schema_name, db_name, self.file_path.get(),
+                        delimiter_val, self.truncate_before_insert.get()
+                    )
+                    # Rows are loaded by the server, so none are processed here
+                    total_rows_processed = 0
+                else:
+                    total_rows_processed = SQLGenerator.generate_insert_script(
+                        file_path, table_name, schema_name, db_name, col_names, column_types,
+                        self.data_cache, self.batch_insert_var.get(), self.insert_batch_size,
+                        self.truncate_before_insert.get(), progress_cb, cancel_check
+                    )
                 
                 if total_rows_processed is None: # Cancelled
                     if log_callback and log_data:
@@ -1066,6 +1140,8 @@ class SQLTableBuilder:
 
                 # Update log data if provided
                 if log_data is not None:
+                    # Streaming a large file replaces its estimated row count with the exact one
+                    log_data['source_total_rows'] = self.data_cache.file_info['total_rows']
                     log_data['insert_script_generated'] = True
                     log_data['insert_script_name'] = os.path.basename(file_path)
                     log_data['insert_script_path'] = file_path
@@ -1120,7 +1196,16 @@ class SQLTableBuilder:
                 return None
 
         # Always run generation in background thread
-        return self.executor.submit(generate_task)
+        self.run_in_background(generate_task)
+
+    def get_inferred_types(self):
+        """Infer column types from the cached sample once per loaded file"""
+        if self.data_cache.inferred_types is None:
+            self.data_cache.inferred_types = self.type_inferrer.infer_column_types(
+                self.data_cache.sample_rows, 
+                self.headers
+            )
+        return self.data_cache.inferred_types
 
     def reset_data_types_immediately(self):
         """Reset data types immediately without progress window"""
@@ -1129,10 +1214,7 @@ class SQLTableBuilder:
             
         try:
             # Use cached sample data for type inference
-            inferred_types = self.type_inferrer.infer_column_types(
-                self.data_cache.sample_rows, 
-                self.headers
-            )
+            inferred_types = self.get_inferred_types()
             
             # Update UI immediately - only reset types for original columns (not added ones)
             original_column_count = len(self.headers)
@@ -1143,6 +1225,7 @@ class SQLTableBuilder:
                     combo.insert(0, inferred_type)
             
             # Leave manually added columns' data types unchanged
+            self.update_truncate_enable_state()
             
             # Disable reset button after resetting
             self.reset_button.config(state="disabled")
@@ -1159,18 +1242,15 @@ class SQLTableBuilder:
         
         def infer_task():
             try:
-                progress.update_text("Analyzing data patterns...")
+                progress.post_text("Analyzing data patterns...")
                 
                 # Use cached sample data for type inference
-                inferred_types = self.type_inferrer.infer_column_types(
-                    self.data_cache.sample_rows, 
-                    self.headers
-                )
+                inferred_types = self.get_inferred_types()
                 
                 if progress.cancelled:
                     return
                     
-                progress.update_text("Updating column types...")
+                progress.post_text("Updating column types...")
                 
                 # Schedule UI update on main thread
                 def update_ui():
@@ -1184,6 +1264,7 @@ class SQLTableBuilder:
                                 combo.insert(0, inferred_type)
                         
                         # Leave manually added columns' data types unchanged
+                        self.update_truncate_enable_state()
                         
                         # Enable the reset button after type inference (initial or user-initiated)
                         self.reset_button.config(state="normal")
@@ -1203,7 +1284,7 @@ class SQLTableBuilder:
                 self.master.after(0, lambda: [progress.close(), messagebox.showerror("Error", f"Failed to infer types: {e}")])
         
         # Run type inference in background thread
-        self.executor.submit(infer_task)
+        self.run_in_background(infer_task)
 
     def set_inferred_types(self):
         """Legacy method - now redirects to async version"""
@@ -1302,7 +1383,7 @@ class SQLTableBuilder:
         
         def load_preview_task():
             try:
-                progress.update_text("Reading file...")
+                progress.post_text("Reading file...")
                 
                 delimiter_val = self.delimiter.get()
                 # Handle delimiter for non-JSON files
@@ -1320,7 +1401,7 @@ class SQLTableBuilder:
                 # Update headers
                 self.headers = self.data_cache.headers
                 
-                progress.update_text("Generating preview...")
+                progress.post_text("Generating preview...")
                 
                 # Schedule UI update on main thread
                 self.master.after(0, lambda: [
@@ -1335,10 +1416,76 @@ class SQLTableBuilder:
                 ])
         
         # Run file loading in background thread
-        self.executor.submit(load_preview_task)
+        self.run_in_background(load_preview_task)
+
+    def get_preview_stats_text(self, rows, headers):
+        # Get delimiter for display using descriptive name
+        delimiter_display = self.get_delimiter_display_name(self.delimiter.get())
+        return f"📋 {len(rows)} rows - {len(headers)} columns - Delimiter: {delimiter_display}"
+
+    def get_preview_info_text(self, rows, total_sample, percentage):
+        preview_info = f"Showing {len(rows):,} of {total_sample:,} sample rows ({percentage}%)"
+        if self.data_cache.file_info:
+            if self.data_cache.file_info.get('file_type') == 'json':
+                total_actual = self.data_cache.file_info.get('total_rows', 'Unknown')
+                preview_info += f" | Total: {total_actual:,} rows"
+            elif self.data_cache.file_info.get('is_large_file'):
+                total_est = self.data_cache.file_info.get('estimated_rows', 'Unknown')
+                preview_info += f" | Est. total: {total_est:,} rows"
+        return preview_info
+
+    def fill_preview_tree(self, tree, headers, rows):
+        """Size the preview columns for rows and insert them with alternating colors"""
+        for i, header in enumerate(headers):
+            # Adjust column width based on content
+            max_width = max(len(header) * 8, 100)
+            if rows:
+                # Check sample data to estimate better width
+                sample_values = [str(row[i] if i < len(row) else '') for row in rows[:5]]
+                max_content = max(len(val) for val in sample_values) if sample_values else 0
+                max_width = max(max_width, min(max_content * 8, 200))
+            tree.column(header, width=max_width, anchor='w', minwidth=80)
+
+        insert = tree.insert
+        column_count = len(headers)
+        row_tags = (('evenrow',), ('oddrow',))
+        for i, row in enumerate(rows):
+            values = []
+            for val in row[:column_count]:
+                text = str(val)
+                values.append(text[:50] + '...' if len(text) > 50 else text)
+            # Ensure row has values for all columns
+            values.extend([''] * (column_count - len(values)))
+            
+            # Insert with tags for alternating colors
+            insert("", "end", values=values, tags=row_tags[i % 2])
+
+    def refresh_preview_rows(self, percentage):
+        """Swap the rows of an existing preview in place; False if it has to be rebuilt"""
+        if not self.preview_widgets or not self.data_cache.is_loaded:
+            return False
+        tree, stats_label, info_label, headers = self.preview_widgets
+        sample_rows = self.data_cache.sample_rows
+        # A new load produces a new headers list, which needs new columns
+        if headers is not self.data_cache.headers or not sample_rows or not tree.winfo_exists():
+            return False
+        
+        total_sample = len(sample_rows)
+        count = max(1, int((percentage / 100) * total_sample))
+        rows = sample_rows[:count]
+        
+        tree.delete(*tree.get_children())
+        self.fill_preview_tree(tree, headers, rows)
+        stats_label.config(text=self.get_preview_stats_text(rows, headers))
+        info_label.config(text=self.get_preview_info_text(rows, total_sample, percentage))
+        return True
 
     def update_preview_table(self, percentage=1):
         """Enhanced preview table with modern styling and visual improvements"""
+        if self.refresh_preview_rows(percentage):
+            return
+        self.preview_widgets = None
+        
         for widget in self.preview_frame.winfo_children():
             widget.destroy()
 
@@ -1391,10 +1538,7 @@ class SQLTableBuilder:
             header_section.pack(fill='x', padx=2, pady=2)
             header_section.pack_propagate(False)
             
-            # Get delimiter for display using descriptive name
-            delimiter_display = self.get_delimiter_display_name(self.delimiter.get())
-            
-            stats_text = f"📋 {len(rows)} rows - {len(headers)} columns - Delimiter: {delimiter_display}"
+            stats_text = self.get_preview_stats_text(rows, headers)
             stats_label = tk.Label(header_section, text=stats_text, 
                                  font=('Arial', 9, 'bold'), bg='#F8F9FA', fg='#495057')
             stats_label.pack(side='left', padx=10, pady=8)
@@ -1454,26 +1598,12 @@ class SQLTableBuilder:
             y_scroll.config(command=tree.yview)
 
             # Configure column headers with enhanced styling
-            for i, header in enumerate(headers):
+            for header in headers:
                 tree.heading(header, text=f"  {header}  ", anchor='w')
-                # Adjust column width based on content
-                max_width = max(len(header) * 8, 100)
-                if rows:
-                    # Check sample data to estimate better width
-                    sample_values = [str(row[i] if i < len(row) else '') for row in rows[:5]]
-                    max_content = max(len(val) for val in sample_values) if sample_values else 0
-                    max_width = max(max_width, min(max_content * 8, 200))
-                tree.column(header, width=max_width, anchor='w', minwidth=80)
-
-            # Add data with alternating row colors
-            for i, row in enumerate(rows):
-                # Ensure row has values for all columns
-                padded_row = row + [''] * (len(headers) - len(row))
-                values = [str(val)[:50] + '...' if len(str(val)) > 50 else str(val) for val in padded_row[:len(headers)]]
-                
-                # Insert with tags for alternating colors
-                tags = ('evenrow',) if i % 2 == 0 else ('oddrow',)
-                tree.insert("", "end", values=values, tags=tags)
+
+            # Add data with alternating row colors. The tree is not packed
+            # yet, so inserting rows triggers no intermediate redraws.
+            self.fill_preview_tree(tree, headers, rows)
 
             # Configure alternating row colors
             tree.tag_configure('evenrow', background='#FFFFFF')
@@ -1490,15 +1620,7 @@ class SQLTableBuilder:
             footer_frame.pack_propagate(False)
             
             # Left side - preview info
-            preview_info = f"Showing {len(rows):,} of {total_sample:,} sample rows ({percentage}%)"
-            if self.data_cache.file_info:
-                if self.data_cache.file_info.get('file_type') == 'json':
-                    total_actual = self.data_cache.file_info.get('total_rows', 'Unknown')
-                    preview_info += f" | Total: {total_actual:,} rows"
-                elif self.data_cache.file_info.get('is_large_file'):
-                    total_est = self.data_cache.file_info.get('estimated_rows', 'Unknown')
-                    preview_info += f" | Est. total: {total_est:,} rows"
-            
+            preview_info = self.get_preview_info_text(rows, total_sample, percentage)
             info_label = tk.Label(footer_frame, text=preview_info, 
                                 font=('Arial', 8), bg='#E9ECEF', fg='#495057')
             info_label.pack(side='left', padx=8, pady=6)
@@ -1509,6 +1631,9 @@ class SQLTableBuilder:
                                    font=('Arial', 8), bg='#D4EDDA', fg='#155724',
                                    relief='solid', bd=1, padx=4, pady=2)
             quality_label.pack(side='right', padx=8, pady=4)
+            
+            # Later percentage changes for the same data only swap the rows
+            self.preview_widgets = (tree, stats_label, info_label, headers)
 
         except Exception as e:
             # Enhanced error display
@@ -1522,7 +1647,8 @@ class SQLTableBuilder:
                     font=('Arial', 9), bg='#F8D7DA', fg='#721C24', wraplength=400).pack(pady=(5, 15))
 
     def apply_config_settings(self):
-        self.config_mgr.load()
+        # ConfigManager loads the file once and keeps its dict current on save,
+        # so there is nothing to re-read here
         cfg = self.config_mgr.config
         self.schema_name.set(cfg.get("default_schema", "dbo"))
         self.database_name.set(cfg.get("default_database", ""))
@@ -1532,7 +1658,7 @@ class SQLTableBuilder:
         self.infer_types_var.set(cfg.get("default_infer_types", True))
         self.sample_percentage = cfg.get("sample_percentage", 15)
 
-        self.insert_batch_size = int(cfg.get("insert_batch_size") or 500)
+        self.insert_batch_size = min(int(cfg.get("insert_batch_size") or MAX_INSERT_ROWS), MAX_INSERT_ROWS)
          # Only initialize truncate_before_insert if it doesn't exist, then apply config setting
         if not hasattr(self, 'truncate_before_insert'):
             self.truncate_before_insert = tk.BooleanVar()
@@ -1559,9 +1685,6 @@ class SQLTableBuilder:
         
         # Update large file indicator if a file is currently selected
         current_file = self.file_path.get()
-        if current_file:
-            self.update_large_file_indicator(current_file)
-        current_file = self.file_path.get()
         if current_file:
             self.update_large_file_indicator(current_file)
 
@@ -1572,14 +1695,10 @@ class SQLTableBuilder:
         except Exception:
             pass
 
-        # Try to update batch checkbox label if present
+        # Update batch checkbox label if the checkbox widget exists
         try:
-            for widget in self.master.winfo_children():
-                if isinstance(widget, tk.LabelFrame) and 'Script Generator' in widget.cget('text'):
-                    for cb in widget.winfo_children():
-                        for child in cb.winfo_children():
-                            if isinstance(child, tk.Checkbutton) and 'Batch' in child.cget('text'):
-                                child.config(text=f"Batch ({self.insert_batch_size})")
+            if hasattr(self, 'batch_insert_check') and self.batch_insert_check.winfo_exists():
+                self.batch_insert_check.config(text=f"Batch INSERT ({self.insert_batch_size})")
         except Exception:
             pass
 
@@ -1589,7 +1708,6 @@ class SQLTableBuilder:
 
     def open_github_repository(self):
         """Open the GitHub repository in the default web browser"""
-        import webbrowser
         try:
             webbrowser.open("https://github.com/jackworthen/sql-builder")
         except Exception as e:
@@ -1620,6 +1738,8 @@ class SQLTableBuilder:
         type_combo.bind("<<ComboboxSelected>>", lambda e, idx=new_index: self.enable_reset_button(idx))
         type_combo.bind("<KeyRelease>", lambda e, idx=new_index: self.enable_reset_button(idx))
         type_combo.bind("<Button-1>", lambda e, idx=new_index: self.enable_reset_button(idx))
+        type_combo.bind("<<ComboboxSelected>>", self.update_truncate_enable_state, add="+")
+        type_combo.bind("<KeyRelease>", self.update_truncate_enable_state, add="+")
 
         null_checkbox = tk.Checkbutton(row, variable=null_var, command=lambda idx=new_index: self.update_null_states(idx))
         null_checkbox.pack(side="left")
@@ -1638,6 +1758,8 @@ class SQLTableBuilder:
         
         # Enable the remove column button since we now have at least one added column
         self.remove_column_button.config(state="normal")
+        # An added column has no source field, which rules out BULK INSERT
+        self.update_truncate_enable_state()
 
     def remove_last_column(self):
         """Remove the last added column"""
@@ -1676,13 +1798,19 @@ class SQLTableBuilder:
             # Re-enable add button if it was disabled due to max columns
             if self.additional_column_count < self.max_additional_columns:
                 self.add_column_button.config(state="normal")
+            
+            self.update_truncate_enable_state()
+
+    def run_in_background(self, task):
+        """Run a task on the worker pool; tasks report back through master.after"""
+        self.executor.submit(task)
 
     def safe_exit(self):
         """Safely exit the application by shutting down background threads"""
         try:
-            # Shutdown the executor and wait briefly for threads to complete
+            # Stop accepting work; a running script generation still finishes
+            # at interpreter exit, so no partial .tmp file is left behind
             self.executor.shutdown(wait=False)
-            # Force quit immediately without waiting for all threads
             self.master.quit()
             self.master.destroy()
         except Exception: